@@ -2,14 +2,15 @@
 import itertools
 import pathlib
 
-from setuptools import setup, find_packages
+from setuptools import setup
 
 
 here = pathlib.Path(__file__).parent
 
 package_name = 'zoom_api_helper'
 
-packages = find_packages(include=[package_name, f'{package_name}.*'])
+# no subpackages, so list the package explicitly.
+packages = [package_name]
 
 requires = [
     'requests',
@@ -23,7 +24,9 @@ test_requirements = [
 ]
 
 extras_require = {
-   'excel': ['sheet2dict'],
+   'excel': ['python-calamine', 'openpyxl'],
+   'orjson': ['orjson'],
+   'http2': ['httpx[http2]'],
 }
 
 # Ref: https://stackoverflow.com/a/71166228/10237506
@@ -1,12 +1,315 @@
 """Tests for `zoom_api_helper` package."""
+import functools
+import json
+import os
+import sys
+import threading
+from datetime import datetime
+from pathlib import Path
+from time import time
 
 import pytest
+import requests
 
 
-from zoom_api_helper import ZoomAPI
+from zoom_api_helper import ZoomAPI, oauth, v2
+from zoom_api_helper.utils import (fast_parse_datetime, read_xlsx_rows,
+                                   save_json_file, write_to_csv)
+
+TEST_XLSX = (Path(__file__).parent.parent / 'integration' /
+             '[DUMMY] Zoom Meeting Information.xlsx')
 
 
 def test_create_zoom_client():
     """Sample pytest test function with the pytest fixture as an argument."""
     zoom = ZoomAPI.dummy_client()
     print(zoom)
+
+
+def test_account_id_from_env(monkeypatch):
+    """`ZOOM_ACCOUNT_ID` is read when the client is created, not at import."""
+    monkeypatch.setenv('ZOOM_ACCOUNT_ID', 'my-account')
+
+    zoom = ZoomAPI.dummy_client()
+    assert zoom._account_id == 'my-account'
+
+
+class Response:
+    """Minimal stand-in for a :class:`requests.Response`."""
+
+    def __init__(self, data, status_code=200):
+        self._data = data
+        self.status_code = status_code
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f'{self.status_code} Error', response=self)
+
+    def json(self):
+        return self._data
+
+
+def test_list_users_all_pages():
+    """Remaining pages are fetched and merged in page order."""
+    zoom = ZoomAPI.dummy_client()
+
+    def _get(url, params=None, session=None):
+        page = params['page_number']
+        return Response({'page_count': 4, 'page_number': page,
+                         'users': [{'id': f'user-{page}'}]})
+
+    zoom._get = _get
+
+    res = zoom.list_users()
+    assert [u['id'] for u in res['users']] == [
+        'user-1', 'user-2', 'user-3', 'user-4']
+
+
+def test_list_users_page_error():
+    """An error response for any page is raised as an HTTP error."""
+    zoom = ZoomAPI.dummy_client()
+
+    def _get(url, params=None, session=None):
+        page = params['page_number']
+        if page == 3:
+            return Response({'code': 429, 'message': 'Too many requests'}, 429)
+        return Response({'page_count': 4, 'page_number': page,
+                         'users': [{'id': f'user-{page}'}]})
+
+    zoom._get = _get
+
+    with pytest.raises(requests.HTTPError):
+        zoom.list_users()
+
+
+def test_bulk_create_meetings(tmp_path):
+    """Responses are matched up with the rows they were created from."""
+    zoom = ZoomAPI.dummy_client()
+
+    def create_meeting(**mtg):
+        if mtg['topic'] == 'Error':
+            raise ValueError('failed to create meeting')
+        return {'join_url': f"https://zoom.us/j/{mtg['topic']}"}
+
+    zoom.create_meeting = create_meeting
+
+    rows = [{'Topic': 'First'}, {'Topic': 'Skipped'},
+            {'Topic': 'Error'}, {'Topic': 'Last'}]
+
+    def update_row(row, resp):
+        row['Meeting URL'] = resp['join_url']
+
+    out_file = tmp_path / 'meetings.out.csv'
+
+    zoom.bulk_create_meetings(
+        rows=rows,
+        process_row=lambda row: row['Topic'] != 'Skipped',
+        update_row=update_row,
+        out_file=out_file,
+    )
+
+    assert [r.get('Meeting URL') for r in rows] == [
+        'https://zoom.us/j/First', None, None, 'https://zoom.us/j/Last']
+    assert out_file.exists()
+
+
+@pytest.mark.parametrize('s', [
+    '2025-10-26 3:30 PM',
+    '2025-10-26 12:05 AM',
+    '2025-10-26 12:05 pm',
+    '2025-1-2 9:00 AM',
+])
+def test_fast_parse_datetime(s):
+    assert fast_parse_datetime(s) == datetime.strptime(s, '%Y-%m-%d %I:%M %p')
+
+
+@pytest.mark.parametrize('s', [
+    '2025-10-26 13:30 PM',
+    '2025-+1-26 3:30 PM',
+    '2025- 1-26 3:30 PM',
+    '+025-10-26 3:30 PM',
+    '2025-10-26 ²:30 PM',
+])
+def test_fast_parse_datetime_invalid(s):
+    with pytest.raises(ValueError):
+        datetime.strptime(s, '%Y-%m-%d %I:%M %p')
+
+    with pytest.raises(ValueError):
+        fast_parse_datetime(s)
+
+
+def test_bulk_create_meetings_prefetches_user_ids(tmp_path):
+    """The user email to ID mapping is retrieved once, before any meetings are created."""
+    zoom = ZoomAPI.dummy_client()
+    lookup_threads = []
+    host_ids = []
+
+    def user_email_to_id(use_cache=False):
+        lookup_threads.append(threading.current_thread())
+        return {'host@email.org': 'host-id'}
+
+    def create_meeting(**mtg):
+        # the mapping should already be cached, before any thread needs it.
+        assert '_user_email_to_id_cached' in zoom.__dict__
+        host_ids.append(zoom._user_email_to_id_cached[mtg['host_email']])
+        return {}
+
+    zoom.user_email_to_id = user_email_to_id
+    zoom.create_meeting = create_meeting
+
+    zoom.bulk_create_meetings(
+        rows=[{'Host Email': 'host@email.org'}] * 3,
+        out_file=tmp_path / 'meetings.out.csv',
+    )
+
+    assert lookup_threads == [threading.main_thread()]
+    assert host_ids == ['host-id'] * 3
+
+
+def test_create_zoom_client_http2(monkeypatch):
+    """With `http2` enabled, requests are sent through an `httpx.Client`."""
+    httpx = pytest.importorskip('httpx')
+    requests_sent = []
+
+    def handler(request: 'httpx.Request'):
+        requests_sent.append(request)
+        return httpx.Response(201, json={'id': 123})
+
+    client_cls = httpx.Client
+    monkeypatch.setattr(httpx, 'Client', functools.partial(
+        client_cls, transport=httpx.MockTransport(handler)))
+
+    zoom = ZoomAPI('...', '...', local=True, http2=True)
+    assert isinstance(zoom._session, client_cls)
+    assert zoom._session.headers['Authorization'] == 'Bearer abc12345'
+    assert zoom._session.headers['Content-Type'] == 'application/json'
+
+    r = zoom._post('https://api.zoom.us/v2/users/me/meetings', {'topic': 'Test'})
+    assert r.json() == {'id': 123}
+
+    request, = requests_sent
+    assert request.headers['Authorization'] == 'Bearer abc12345'
+    assert json.loads(request.content) == {'topic': 'Test'}
+
+
+def test_write_to_csv_union_of_keys(tmp_path):
+    """Columns only present in later rows are still written out."""
+    out_file = tmp_path / 'out.csv'
+
+    write_to_csv(out_file, [{'Topic': 'a'},
+                            {'Topic': 'b', 'id': 123, 'join_url': 'u'}])
+
+    assert out_file.read_text().splitlines() == [
+        'Topic,id,join_url', 'a,,', 'b,123,u']
+
+
+def test_get_access_token_in_memory_cache(monkeypatch, tmp_path):
+    """Tokens are cached in memory first, then in the file cache."""
+    monkeypatch.setattr(oauth, 'CACHE_DIR', tmp_path)
+    monkeypatch.setattr(oauth, '_TOKEN_CACHE', {})
+    oauth._token_path.cache_clear()
+
+    class Session:
+        calls = 0
+
+        def post(self, url, auth=None, params=None):
+            self.calls += 1
+            return Response({'access_token': 'live-token', 'expires_in': 3600})
+
+    session = Session()
+    key = ('account', 'client')
+    token_file = tmp_path / 'token_account_client.json'
+
+    # miss: the token is fetched live, and cached in memory and on disk.
+    assert oauth.get_access_token(session, *key, 'secret') == 'live-token'
+    assert session.calls == 1
+    assert oauth._TOKEN_CACHE[key][0] == 'live-token'
+    assert token_file.exists()
+
+    # hit: the in-memory token is used, without reading the file.
+    token_file.unlink()
+    assert oauth.get_access_token(session, *key, 'secret') == 'live-token'
+    assert session.calls == 1
+
+    # expired: falls back to the file cache, and updates the in-memory cache.
+    oauth._TOKEN_CACHE[key] = 'expired-token', 0
+    save_json_file(token_file, {'access_token': 'file-token',
+                                'expires_at': round(time()) + 3600})
+    assert oauth.get_access_token(session, *key, 'secret') == 'file-token'
+    assert session.calls == 1
+    assert oauth._TOKEN_CACHE[key][0] == 'file-token'
+
+    oauth._token_path.cache_clear()
+
+
+def test_read_xlsx_rows_backends_match(monkeypatch):
+    """Both `python-calamine` and `openpyxl` read the same rows."""
+    pytest.importorskip('python_calamine')
+    pytest.importorskip('openpyxl')
+
+    calamine_rows = list(read_xlsx_rows(TEST_XLSX))
+
+    # force the `python-calamine` import to fail.
+    monkeypatch.setitem(sys.modules, 'python_calamine', None)
+    openpyxl_rows = list(read_xlsx_rows(TEST_XLSX))
+
+    assert calamine_rows == openpyxl_rows
+    assert len(calamine_rows) == 4
+    assert calamine_rows[0]['Meeting Date'] == '2025-10-26 00:00:00'
+    assert calamine_rows[0]['Duration Hr'] == '1'
+    assert calamine_rows[0]['Meeting URL'] == ''
+
+
+def test_read_xlsx_rows_first_sheet(monkeypatch, tmp_path):
+    """The first sheet is read with either backend, even if it is not active."""
+    openpyxl = pytest.importorskip('openpyxl')
+    pytest.importorskip('python_calamine')
+
+    wb = openpyxl.Workbook()
+    wb.active.title = 'Notes'
+    wb.active.append(['Note'])
+    wb.active.append(['x'])
+    meetings = wb.create_sheet('Meetings')
+    meetings.append(['Topic'])
+    meetings.append(['A'])
+    wb.active = meetings
+
+    excel_file = tmp_path / 'meetings.xlsx'
+    wb.save(excel_file)
+
+    assert list(read_xlsx_rows(excel_file)) == [{'Note': 'x'}]
+
+    monkeypatch.setitem(sys.modules, 'python_calamine', None)
+    assert list(read_xlsx_rows(excel_file)) == [{'Note': 'x'}]
+
+
+def test_user_email_to_id_cache(monkeypatch, tmp_path):
+    """The users file is only re-read when it changes on disk."""
+    users_file = tmp_path / 'users.json'
+    monkeypatch.setattr(v2, '_users_path', lambda *_: users_file)
+    monkeypatch.setattr(v2, '_USERS_CACHE', {})
+
+    reads = []
+    monkeypatch.setattr(v2, 'read_json_file_if_exists',
+                        lambda f: reads.append(f) or json.loads(f.read_text()))
+
+    save_json_file(users_file, {'a@email.org': 'a-id'})
+    zoom = ZoomAPI.dummy_client()
+
+    users = zoom.user_email_to_id(use_cache=True)
+    assert users == {'a@email.org': 'a-id'}
+    assert len(reads) == 1
+
+    # unchanged file: served from memory, as a copy of the cached mapping.
+    users['b@email.org'] = 'b-id'
+    assert ZoomAPI.dummy_client().user_email_to_id(use_cache=True) == {
+        'a@email.org': 'a-id'}
+    assert len(reads) == 1
+
+    # file rewritten by someone else: reloaded from disk.
+    save_json_file(users_file, {'c@email.org': 'c-id'})
+    st = users_file.stat()
+    os.utime(users_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1))
+
+    assert zoom.user_email_to_id(use_cache=True) == {'c@email.org': 'c-id'}
+    assert len(reads) == 2
@@ -4,6 +4,7 @@ __all__ = [
     'API_USERS',
     'CACHE_DIR',
     'CREATE_MEETING_KWARGS',
+    'CREATE_MEETING_KWARG_IDENTITY',
 ]
 
 from os import getenv
@@ -21,11 +22,14 @@ CACHE_DIR.mkdir(parents=True, exist_ok=True)
 # Create Meeting API - valid keyword arguments
 #
 # Ref: https://marketplace.zoom.us/docs/api-reference/zoom-api/methods/#operation/meetingCreate
-CREATE_MEETING_KWARGS = {
+CREATE_MEETING_KWARGS = frozenset({
     # Extras: used by our `create_meeting` method
     'host_id', 'host_email',
     # Zoom API keyword arguments
     'agenda', 'start_time', 'template_id', 'password', 'timezone', 'topic',
     'tracking_fields', 'duration', 'recurrence', 'default_password',
     'pre_schedule', 'settings', 'schedule_for', 'type'
-}
+})
+
+# Mapping of each keyword argument for the Create Meeting API to itself.
+CREATE_MEETING_KWARG_IDENTITY = {kwarg: kwarg for kwarg in CREATE_MEETING_KWARGS}
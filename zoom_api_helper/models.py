@@ -8,11 +8,15 @@ from typing import TYPE_CHECKING
 
 # noinspection GrazieInspection
 if TYPE_CHECKING:
-    __all__ += ['RowType', 'ProcessRow', 'UpdateRow']
+    __all__ += ['RowType', 'ProcessRow', 'UpdateRow', 'SessionType']
 
     from datetime import datetime
     from typing import Any
 
+    # noinspection PyPackageRequirements
+    import httpx
+    import requests
+
     try:
         from typing import Protocol
     except ImportError:  # Python 3.7
@@ -20,11 +24,15 @@ if TYPE_CHECKING:
 
     # Type of Excel Row.
     #
-    # Typically, `sheet2dict` passes this in as `dict[str, str]`, however the
+    # Typically, `read_xlsx_rows` passes this in as `dict[str, str]`, however the
     # type restrictions can be lifted a little, so that a user assignment
     # won't result in warnings.
     RowType = dict[str, str | datetime | bool | int | float | dict | list | None]
 
+    # Type of HTTP client used to send requests; an `httpx.Client` is used
+    # when HTTP/2 is enabled.
+    SessionType = requests.Session | httpx.Client
+
 
     class ProcessRow(Protocol):
 
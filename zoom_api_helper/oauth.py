@@ -1,12 +1,29 @@
-from time import time
+from __future__ import annotations
 
-import requests
+from functools import lru_cache
+from pathlib import Path
+from time import time
+from typing import TYPE_CHECKING
 
 from .constants import CACHE_DIR
 from .utils import read_json_file_if_exists, save_json_file
 
 
-def get_access_token(session: requests.Session,
+if TYPE_CHECKING:
+    from .models import SessionType
+
+
+# In-memory cache of access tokens, as a mapping of `(account_id, client_id)`
+# to `(access_token, expires_at)`.
+_TOKEN_CACHE: dict[tuple[str, str], tuple[str, int]] = {}
+
+
+@lru_cache(maxsize=32)
+def _token_path(account_id: str, client_id: str) -> Path:
+    return CACHE_DIR / f'token_{account_id}_{client_id}.json'
+
+
+def get_access_token(session: SessionType,
                      account_id: str,
                      client_id: str,
                      client_secret: str) -> str:
@@ -22,18 +39,26 @@ def get_access_token(session: requests.Session,
         - https://marketplace.zoom.us/docs/guides/build/server-to-server-oauth-app/
 
 
-    :param session: (Optional) Requests Session
+    :param session: (Optional) Requests Session, or `httpx` Client
     :param account_id: Zoom Account ID
     :param client_id: OAuth app Client ID
     :param client_secret: OAuth app Client Secret
 
     :return: The access token for the app.
     """
-    filename = CACHE_DIR / f'token_{account_id}_{client_id}.json'
+    key = (account_id, client_id)
+
+    # first, check the in-memory cache for the access token.
+    cached = _TOKEN_CACHE.get(key)
+    if cached and cached[1] > round(time()):
+        return cached[0]
+
+    filename = _token_path(account_id, client_id)
 
-    # first, check the cache for the access token.
+    # next, check the file cache for the access token.
     cache = read_json_file_if_exists(filename)
     if cache and cache['expires_at'] > round(time()):
+        _TOKEN_CACHE[key] = cache['access_token'], cache['expires_at']
         return cache['access_token']
 
     # else, we make a live API call to retrieve the token.
@@ -58,5 +83,6 @@ def get_access_token(session: requests.Session,
     # save the access token to the cache.
     cache = {'access_token': token, 'expires_at': expires_at}
     save_json_file(filename, cache)
+    _TOKEN_CACHE[key] = token, expires_at
 
     return token
@@ -3,17 +3,21 @@ from __future__ import annotations
 __all__ = [
     'cached_property',
     'CustomEncoder',
+    'fast_parse_datetime',
+    'json_default',
     'log_time',
     'read_json_file_if_exists',
+    'read_xlsx_rows',
     'save_json_file',
     'write_to_csv',
 ]
 
-from csv import DictWriter
-from datetime import datetime
+from csv import writer as csv_writer
+from datetime import date, datetime
 from json import load, dump, JSONEncoder
+from logging import DEBUG
 from time import time
-from typing import TYPE_CHECKING, Any, TypeVar
+from typing import TYPE_CHECKING, Any, Iterator, TypeVar
 
 from functools import wraps
 
@@ -23,19 +27,36 @@ except ImportError:
     # noinspection PyUnresolvedReferences, PyPackageRequirements
     from backports.cached_property import cached_property
 
+try:
+    # noinspection PyPackageRequirements
+    import orjson
+except ImportError:
+    orjson = None
+
 from .log import LOG
 
 
+def json_default(o: Any) -> Any:
+    """`default` function to serialize objects not natively supported by `json`."""
+    if isinstance(o, datetime):
+        return o.isoformat()
+
+    raise TypeError(f'Object of type {o.__class__.__name__} '
+                    f'is not JSON serializable')
+
+
 class CustomEncoder(JSONEncoder):
 
     def default(self, o: Any) -> Any:
-        if isinstance(o, datetime):
-            return o.isoformat()
-
-        return JSONEncoder.default(self, o)
+        try:
+            return json_default(o)
+        except TypeError:
+            return JSONEncoder.default(self, o)
 
 
 if TYPE_CHECKING:
+    from os import PathLike
+
     _F = TypeVar('_F')
 
 
@@ -43,6 +64,10 @@ def log_time(func: _F) -> _F:
 
     @wraps(func)
     def inner(*args, _fn_name=func.__name__, **kwargs):
+        # skip timing the call, if the log message would be dropped anyway.
+        if not LOG.isEnabledFor(DEBUG):
+            return func(*args, **kwargs)
+
         start = time()
         ret = func(*args, **kwargs)
         end = time()
@@ -54,8 +79,41 @@ def log_time(func: _F) -> _F:
     return inner
 
 
+def fast_parse_datetime(s: str) -> datetime:
+    """Parse a date and time string in the ``YYYY-MM-DD HH:MM AM/PM`` format,
+    such as ``2025-10-26 3:30 PM``.
+
+    This is equivalent to ``datetime.strptime(s, '%Y-%m-%d %I:%M %p')``, but is
+    faster as it parses the string by slicing; strings that don't match the
+    expected format fall back to :meth:`datetime.strptime`.
+    """
+    hour, _, minute = s[11:-3].partition(':')
+    meridiem = s[-2:].upper()
+
+    # `isdigit` alone also accepts non-ASCII digits, such as '²'.
+    if (s.isascii() and
+            s[4:5] == s[7:8] == '-' and s[10:11] == s[-3:-2] == ' ' and
+            s[:4].isdigit() and s[5:7].isdigit() and s[8:10].isdigit() and
+            hour.isdigit() and len(hour) <= 2 and
+            minute.isdigit() and len(minute) == 2 and
+            meridiem in ('AM', 'PM') and
+            1 <= int(hour) <= 12):
+        try:
+            return datetime(int(s[:4]), int(s[5:7]), int(s[8:10]),
+                            int(hour) % 12 + (12 if meridiem == 'PM' else 0),
+                            int(minute))
+        except ValueError:
+            pass
+
+    return datetime.strptime(s, '%Y-%m-%d %I:%M %p')
+
+
 def read_json_file_if_exists(filename: str) -> dict | list | None:
     try:
+        if orjson is not None:
+            with open(filename, 'rb') as in_file:
+                return orjson.loads(in_file.read())
+
         with open(filename) as in_file:
             return load(in_file)
 
@@ -64,12 +122,73 @@ def read_json_file_if_exists(filename: str) -> dict | list | None:
 
 
 def save_json_file(filename: str, data: dict | list):
+    if orjson is not None:
+        with open(filename, 'wb') as out_file:
+            out_file.write(orjson.dumps(data, default=json_default))
+        return
+
     with open(filename, 'w') as out_file:
-        dump(data, out_file)
+        dump(data, out_file, default=json_default)
+
+
+def _cell_to_str(value: Any) -> str:
+    if value is None:
+        return ''
+
+    # `python-calamine` reads in all numbers as floats.
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    # `python-calamine` reads in date-only cells as `date` objects.
+    elif type(value) is date:
+        value = datetime(value.year, value.month, value.day)
+
+    return str(value)
+
+
+def read_xlsx_rows(excel_file: str | PathLike[str]) -> Iterator[dict[str, str]]:
+    """Read the rows from the first sheet of an Excel (.xlsx) file, as a mapping
+    of column header to cell value.
+
+    Uses ``python-calamine`` if it is installed, and falls back to ``openpyxl``
+    in read-only mode otherwise. Cell values are converted to strings (with
+    empty cells as ``''``) so that rows look the same with either library.
+
+    Note that the first sheet in the workbook is always read, regardless of
+    which sheet was active when the file was last saved, as ``python-calamine``
+    has no notion of an active sheet.
+    """
+    try:
+        # noinspection PyUnresolvedReferences, PyPackageRequirements
+        from python_calamine import CalamineWorkbook
+
+    except ImportError:
+        # noinspection PyUnresolvedReferences, PyPackageRequirements
+        from openpyxl import load_workbook
+
+        wb = load_workbook(excel_file, read_only=True, data_only=True)
+        try:
+            values = wb.worksheets[0].iter_rows(values_only=True)
+            headers = next(values)
+            for row in values:
+                yield dict(zip(headers, map(_cell_to_str, row)))
+        finally:
+            wb.close()
+
+    else:
+        values = iter(CalamineWorkbook.from_path(str(excel_file))
+                      .get_sheet_by_index(0)
+                      .to_python())
+        headers = next(values)
+        for row in values:
+            yield dict(zip(headers, map(_cell_to_str, row)))
 
 
 def write_to_csv(out_file: str, rows: list[dict]):
+    # union of keys across all rows, as for example `update_row` might only
+    # add response fields to the rows for which a meeting was created.
+    fieldnames = list(dict.fromkeys(k for r in rows for k in r))
+
     with open(out_file, 'w') as output:
-        writer = DictWriter(output, fieldnames=rows[0].keys())
-        writer.writeheader()
-        writer.writerows(rows)
+        writer = csv_writer(output)
+        writer.writerow(fieldnames)
+        writer.writerows([r.get(k, '') for k in fieldnames] for r in rows)
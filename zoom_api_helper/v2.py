@@ -2,12 +2,14 @@ from __future__ import annotations
 
 import json
 import os
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from .constants import *
 from .log import LOG
@@ -16,11 +18,32 @@ from .oauth import get_access_token
 from .utils import *
 
 
+# In-memory cache of user email to ID mappings, as a mapping of the cache
+# file to `((mtime_ns, size), email_to_id)`.
+_USERS_CACHE: dict[Path, tuple[tuple[int, int], dict[str, str]]] = {}
+
+
+def _file_version(filename: Path) -> tuple[int, int]:
+    st = filename.stat()
+    return st.st_mtime_ns, st.st_size
+
+
+@lru_cache(maxsize=32)
+def _users_path(account_id: str, client_id: str) -> Path:
+    return CACHE_DIR / f'users_{account_id}_{client_id}.json'
+
+
 class ZoomAPI:
     # noinspection GrazieInspection
     """
     Helper client to interact with the `Zoom API v2`_
 
+    If ``http2`` is enabled, requests are sent with an ``httpx`` client over
+    HTTP/2, so that concurrent requests are multiplexed over a single connection.
+    This requires the ``httpx`` library, which can be installed via::
+
+        $ pip install zoom-api-helper[http2]
+
     .. _Zoom API v2: https://marketplace.zoom.us/docs/api-reference/zoom-api/
 
     """
@@ -38,9 +61,28 @@ class ZoomAPI:
     def __init__(self, client_id: str,
                  client_secret: str,
                  account_id: str = None,
-                 local=False):
-
-        self._session = session = requests.Session()
+                 local=False,
+                 max_connections=10,
+                 http2=False):
+
+        if http2:
+            # noinspection PyPackageRequirements
+            import httpx
+
+            # `httpx.Client` is thread-safe, and multiplexes requests
+            # over a single connection with HTTP/2.
+            self._session = session = httpx.Client(
+                http2=True,
+                limits=httpx.Limits(max_connections=max_connections),
+                timeout=None,
+            )
+        else:
+            self._session = session = requests.Session()
+            # share a single connection pool between threads, so that
+            # connections (and TLS handshakes) are re-used across requests.
+            session.mount('https://', HTTPAdapter(pool_connections=max_connections,
+                                                  pool_maxsize=max_connections,
+                                                  pool_block=True))
         self._account_id = account_id = account_id or os.getenv('ZOOM_ACCOUNT_ID')
         self._client_id = client_id
 
@@ -66,18 +108,11 @@ class ZoomAPI:
                 f'account_id={self._account_id!r}, '
                 f'client_id={self._client_id!r})')
 
-    def _new_session(self) -> requests.Session:
-        session = requests.Session()
-        session.headers['Authorization'] = f'Bearer {self._access_token}'
-        session.headers['Content-Type'] = 'application/json'
-
-        return session
-
-    def _get(self, url: str, params: dict = None, session: requests.Session | None = None):
+    def _get(self, url: str, params: dict = None, session: SessionType | None = None):
         LOG.debug('GET %s, params=%s', url, params)
         return (session or self._session).get(url, params=params)
 
-    def _post(self, url: str, data: dict = None, session: requests.Session | None = None):
+    def _post(self, url: str, data: dict = None, session: SessionType | None = None):
         LOG.debug('POST %s, data=%s', url, data)
         return (session or self._session).post(url, json=data)
 
@@ -99,10 +134,11 @@ class ZoomAPI:
         If the rows containing meetings to create lives in an Excel (.xlsx) file,
         then `excel_file` must be passed in, and contain the filepath of the Excel
         file to retrieve the meeting details from; else, `rows` must be passed in
-        with a list of meetings to create.
+        with a list of meetings to create. The meetings are read from the *first*
+        sheet in the Excel file.
 
-        Note that to read from Excel, the ``sheet2dict`` library is required;
-        this can be installed easily via::
+        Note that to read from Excel, the ``python-calamine`` or ``openpyxl``
+        library is required; these can be installed easily via::
 
             $ pip install zoom-api-helper[excel]
 
@@ -113,6 +149,10 @@ class ZoomAPI:
         for a full list of acceptable keywords for the *Create Meeting* API; note
         that these are specified as *values* in the key-value pairing.
 
+        ``max_threads`` is the number of meetings to create concurrently. Note that
+        all threads share the client's connection pool, which is sized via the
+        ``max_connections`` argument to :class:`ZoomAPI`.
+
         ``process_row`` is an optional function or callable that will be called with
         a copy of each *row*, or individual meeting info. The function can modify
         the row in place as desired.
@@ -153,21 +193,15 @@ class ZoomAPI:
             - https://marketplace.zoom.us/docs/api-reference/other-references/abbreviation-lists/#timezones
 
         """
-        # noinspection PyUnresolvedReferences
-        import sheet2dict
-
         def to_snake_case(s: str):
             return s.replace(' ', '_').replace('-', '_').lower()
 
-        if rows:
-            col_headers = rows[0].keys()
-        else:
-            ws = sheet2dict.Worksheet()
-            ws.xlsx_to_dict(excel_file)
-            col_headers = ws.sheet_items[0].keys()
-            rows = ws.sheet_items
+        if not rows:
+            rows = list(read_xlsx_rows(excel_file))
+
+        col_headers = rows[0].keys()
 
-        header_to_kwarg = {kwarg: kwarg for kwarg in CREATE_MEETING_KWARGS}
+        header_to_kwarg = CREATE_MEETING_KWARG_IDENTITY.copy()
 
         if not col_header_to_kwarg:
             col_header_to_kwarg = {h: to_snake_case(h) for h in col_headers}
@@ -177,23 +211,28 @@ class ZoomAPI:
             if kwarg in CREATE_MEETING_KWARGS:
                 header_to_kwarg[h] = kwarg
 
-        meetings_to_create = []
-
-        if process_row is None:
-            def do_nothing(_row): return True
-            process_row = do_nothing
-
-        for row in rows:
-            # copy row so as not to modify it directly.
-            copied_row = row.copy()
+        # (header, kwarg) pairs to retrieve meeting info from each row.
+        header_kwarg_pairs = list(header_to_kwarg.items())
 
-            # optional: process the row.
-            is_valid = process_row(copied_row)
-            if not is_valid:
-                continue
+        meetings_to_create = []
+        # index of the row for each meeting, as some rows can be skipped.
+        meeting_row_idx = []
+
+        for idx, row in enumerate(rows):
+            if process_row is None:
+                # row is only read from, so there's no need to copy it.
+                copied_row = row
+            else:
+                # copy row so as not to modify it directly.
+                copied_row = row.copy()
+
+                # optional: process the row.
+                is_valid = process_row(copied_row)
+                if not is_valid:
+                    continue
 
             # retrieve meeting info.
-            mtg = {header_to_kwarg[h]: copied_row[h] for h in header_to_kwarg
+            mtg = {kwarg: copied_row[h] for h, kwarg in header_kwarg_pairs
                    if h in copied_row}
 
             # add default fields.
@@ -201,6 +240,7 @@ class ZoomAPI:
                 mtg['timezone'] = default_timezone
 
             meetings_to_create.append(mtg)
+            meeting_row_idx.append(idx)
 
         # if it's a dry run, print useful info for debugging purposes, then quit.
         if dry_run:
@@ -208,7 +248,7 @@ class ZoomAPI:
             print(json.dumps(header_to_kwarg, indent=2))
             print()
             print(f'Have {len(meetings_to_create)} Meetings to Create:')
-            print(json.dumps(meetings_to_create, indent=2, cls=CustomEncoder))
+            print(json.dumps(meetings_to_create, indent=2, default=json_default))
             return
 
         LOG.debug('Column Header to Keyword Argument: %s', header_to_kwarg)
@@ -220,33 +260,37 @@ class ZoomAPI:
         LOG.debug('Output File: %s', out_file.absolute())
 
         def create_meeting(mtg_: RowType):
-            # use a separate session for each thread.
-            session = self._new_session()
-            return self.create_meeting(session=session, **mtg_)
+            # return any exception, so that `map` doesn't stop on the first error.
+            try:
+                return self.create_meeting(**mtg_)
+            except Exception as e:
+                return e
 
         if update_row is None:
             update_row = dict.update
 
+        # retrieve the user email to ID mapping up front, rather than
+        # having the first thread that needs it block all the others.
+        if any(mtg.get('host_email') and not mtg.get('host_id')
+               for mtg in meetings_to_create):
+            _ = self._user_email_to_id_cached
+
         with ThreadPoolExecutor(max_workers=max_threads) as executor:
-            # Start the create meeting operations and mark each future with its row index
-            future_to_row_idx = {executor.submit(create_meeting, mtg): i
-                                 for i, mtg in enumerate(meetings_to_create)}
+            # results are yielded in the same order as the meetings to create.
+            results = executor.map(create_meeting, meetings_to_create)
 
-            for future in as_completed(future_to_row_idx):
-                idx = future_to_row_idx[future]
+            for idx, resp_or_exc in zip(meeting_row_idx, results):
                 row = rows[idx]
 
-                try:
-                    resp = future.result()
-                except Exception as exc:
-                    LOG.error('[%d] %r generated an exception: %s', idx, row, exc)
+                if isinstance(resp_or_exc, Exception):
+                    LOG.error('[%d] %r generated an exception: %s', idx, row, resp_or_exc)
                 else:
-                    update_row(row, resp)
+                    update_row(row, resp_or_exc)
 
         write_to_csv(out_file, rows)
 
     def create_meeting(self, *,
-                       session: requests.Session | None = None,
+                       session: SessionType | None = None,
                        host_id: str | None = None,
                        host_email: str | None = None,
                        topic: str = 'My Meeting',
@@ -303,18 +347,31 @@ class ZoomAPI:
         return self.user_email_to_id(use_cache=True)
 
     def user_email_to_id(self, status: str | None = 'active', *, use_cache=False):
-        filename = CACHE_DIR / f'users_{self._account_id}_{self._client_id}.json'
+        filename = _users_path(self._account_id, self._client_id)
 
         if use_cache:
-            users = read_json_file_if_exists(filename)
-            if users:
-                return users
+            try:
+                version = _file_version(filename)
+            except FileNotFoundError:
+                pass
+            else:
+                # skip reading the file, if it hasn't changed since last time.
+                # return a copy, so callers can't modify the cached mapping.
+                cached = _USERS_CACHE.get(filename)
+                if cached and cached[0] == version:
+                    return cached[1].copy()
+
+                users = read_json_file_if_exists(filename)
+                if users:
+                    _USERS_CACHE[filename] = version, users
+                    return users.copy()
 
         users = self.list_users(status)['users']
         email_to_id = {u['email']: u['id'] for u in users}
 
         # save list of users to cache
         save_json_file(filename, email_to_id)
+        _USERS_CACHE[filename] = _file_version(filename), email_to_id.copy()
 
         return email_to_id
 
@@ -337,13 +394,20 @@ class ZoomAPI:
             params['status'] = status
 
         res = self._get(API_USERS, params=params)
+        res.raise_for_status()
         final_data = data = res.json()
 
-        if all_pages:
-            while data['page_count'] > data['page_number']:
-                params['page_number'] += 1
-                res = self._get(API_USERS, params=params)
-                data = res.json()
-                final_data['users'].extend(data['users'])
+        if all_pages and data['page_count'] > data['page_number']:
+            remaining_pages = range(data['page_number'] + 1, data['page_count'] + 1)
+
+            def get_page(page_number: int):
+                res_ = self._get(API_USERS, {**params, 'page_number': page_number})
+                res_.raise_for_status()
+                return res_.json()
+
+            with ThreadPoolExecutor(max_workers=min(10, len(remaining_pages))) as executor:
+                # results are yielded in the same order as the page numbers.
+                for data in executor.map(get_page, remaining_pages):
+                    final_data['users'].extend(data['users'])
 
         return final_data